@@ -23,29 +23,45 @@ Sprint 14: Fix SATCAT returning empty — SATCAT_STATUS=onorbit URL returned
            Adds time.sleep(1) between requests to avoid rate-limiting.
 """
 
-import json
+import asyncio
+import gzip
 import logging
 import math
 import os
+import sys
 import time
+import zlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
+import numpy as np
+import orjson
 import pandas as pd
-from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi import (
+    Body,
+    FastAPI,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
-from skyfield.api import EarthSatellite, load, wgs84
+from sgp4.api import SatrecArray
+from skyfield.api import EarthSatellite, load
 
 from orbit_intel.anomaly import OrbitalAnomalyDetector
 from orbit_intel.dynamics import extract_features, load_tle_objects
-from orbit_intel.ingest import fetch_tle_data
+from orbit_intel.ingest import fetch_tle_data_async
+from orbit_intel.propagation import build_satrec_array, propagate_subpoints
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -99,6 +115,8 @@ CELESTRAK_SATCAT_BASE: str = (
 
 TLE_FILENAME: str = "active_satellites.txt"
 SATCAT_CACHE_FILE: str = "satcat_cache.json"
+# CelesTrak publishes new element sets a few times a day
+TLE_REFRESH_INTERVAL_S: float = 6 * 3600.0
 
 # ---------------------------------------------------------------------------
 # Sprint 12 fix: CelesTrak SATCAT uses abbreviated OBJECT_TYPE codes.
@@ -120,46 +138,222 @@ SATCAT_TYPE_MAP: Dict[str, str] = {
 
 _state: Dict[str, Any] = {
     "satellites_tle": [],
+    "satrec_array": None,      # batched SGP4 records aligned with satellites_tle
+    "names": None,
+    "norad_ids": None,
+    "owners": None,            # SATCAT/TLE metadata aligned with satellites_tle
+    "owner_codes": None,       # int16 category codes for the OSINT filters
+    "owner_vocab": {},         # upper-cased owner -> code
+    "object_types": None,
+    "object_type_codes": None,
+    "object_type_vocab": {},
+    "mean_motion_arr": None,
+    "inclination_arr": None,
+    "anomaly_score_arr": None, # df_anomalies columns aligned with satellites_tle
+    "is_anomaly_arr": None,
     "df_anomalies": None,
+    "n_anomalies": 0,          # df_anomalies["is_anomaly"].sum(), for /health
     "detector": None,
     "last_report": None,
+    "sorted_anomalies": [],    # last_report.satellites, highest score first
+    "scores_desc": None,
+    "anomaly_by_norad": {},    # norad_id -> SatelliteAnomaly
     "satcat_lookup": {},
-    "tle_extra_lookup": {},    # Sprint 9: mean_motion & inclination from TLE
 }
 
+# Upper bound on NORAD IDs per /api/v1/satellites/batch request
+SATELLITE_BATCH_MAX: int = 1000
+
+# Responses below this size are sent uncompressed
+GZIP_MINIMUM_SIZE: int = 1024
+
+# Serialised /api/positions payloads keyed by
+# (tick, filter, owner, type, columnar) -> (etag, json, gzipped json)
+POSITIONS_CACHE_TICK_S: float = 1.0
+_positions_cache: Dict[
+    Tuple[int, str, Optional[str], Optional[str], bool],
+    Tuple[str, bytes, Optional[bytes]],
+] = {}
+_positions_lock = asyncio.Lock()
+# Last /api/v1/analyse run, keyed by (TLE path, mtime_ns, size, contamination)
+_analysis_cache: Dict[Tuple[str, int, int, float], Tuple[Any, ...]] = {}
+# Parsed satellites + feature frame of the last TLE file analysed, keyed
+# by (TLE path, mtime_ns, size); shared by every contamination value
+_features_cache: Dict[
+    Tuple[str, int, int], Tuple[List[EarthSatellite], pd.DataFrame]
+] = {}
+# Bumped whenever the catalogue or anomaly arrays change; payload builds
+# that started under an older generation are not cached
+_positions_generation: int = 0
+# Sub-points for the current tick and SatrecArray, shared by every filter
+_tick_subpoints: Optional[
+    Tuple[int, SatrecArray, np.ndarray, np.ndarray, np.ndarray]
+] = None
+
+
+# Orbit classes as small integer codes; ORBIT_TYPES maps a code to its label
+ORBIT_TYPES: Tuple[str, ...] = ("LEO", "MEO", "GEO")
+ORBIT_CODES: Dict[str, int] = {label: code for code, label in enumerate(ORBIT_TYPES)}
+_ORBIT_LABELS = np.array(ORBIT_TYPES, dtype=object)
+
+
+def classify_orbit_codes(alt_km: np.ndarray) -> np.ndarray:
+    """Vectorised orbit classification: 0 = LEO, 1 = MEO, 2 = GEO."""
+    return np.where(alt_km < 2000, 0, np.where(alt_km > 35000, 2, 1))
+
+
+def _invalidate_positions() -> None:
+    """Drop cached positions and start a new payload generation."""
+    global _positions_generation, _tick_subpoints
+    _positions_generation += 1
+    _positions_cache.clear()
+    _tick_subpoints = None
+
+
+def _set_satellites(sats: List[EarthSatellite]) -> None:
+    """Store the catalogue plus the per-index arrays used by /api/positions.
+
+    The SatrecArray lets one SGP4 call propagate every satellite; names
+    and NORAD IDs are kept as arrays aligned with it so the request path
+    never walks EarthSatellite attributes.
+    """
+    _invalidate_positions()
+    _state["satellites_tle"] = sats
+    _state["satrec_array"] = build_satrec_array(sats) if sats else None
+    _state["names"] = np.array([sat.name for sat in sats], dtype=object)
+    _state["norad_ids"] = np.fromiter(
+        (sat.model.satnum for sat in sats), dtype=np.int64, count=len(sats)
+    )
+    # Sprint 9: mean_motion & inclination from TLE
+    _state["mean_motion_arr"], _state["inclination_arr"] = (
+        build_tle_extra_arrays(sats)
+    )
+    _align_satellite_metadata()
+    _align_anomaly_arrays()
+
+
+def _align_satellite_metadata() -> None:
+    """Build SATCAT arrays aligned with satellites_tle.
+
+    Replaces the per-request ``satcat.get`` lookups with indexed array
+    access, and encodes the upper-cased owner and object_type columns as
+    integer category codes so the OSINT filters become int comparisons.
+    """
+    satcat = _state.get("satcat_lookup", {})
+    norad_ids = _state["norad_ids"]
+    n = len(norad_ids)
+
+    owners = np.empty(n, dtype=object)
+    object_types = np.empty(n, dtype=object)
+    for i, norad_id in enumerate(norad_ids.tolist()):
+        sat_meta = satcat.get(norad_id, {})
+        owners[i] = sat_meta.get("owner", "UNKNOWN")
+        object_types[i] = sat_meta.get("object_type", "UNKNOWN")
+
+    _state["owners"] = owners
+    _state["owner_codes"], _state["owner_vocab"] = _category_codes(owners)
+    _state["object_types"] = object_types
+    _state["object_type_codes"], _state["object_type_vocab"] = (
+        _category_codes(object_types)
+    )
+
+
+def _category_codes(values: np.ndarray) -> Tuple[np.ndarray, Dict[str, int]]:
+    """Encode *values* as int16 codes of their stripped, upper-cased form.
+
+    Returns ``(codes, vocab)`` where ``vocab`` maps each normalised value
+    to its code. Each distinct raw string is normalised only once.
+    """
+    vocab: Dict[str, int] = {}
+    raw_codes: Dict[str, int] = {}
+    codes = np.empty(len(values), dtype=np.int16)
+    for i, value in enumerate(values):
+        code = raw_codes.get(value)
+        if code is None:
+            code = vocab.setdefault(value.strip().upper(), len(vocab))
+            raw_codes[value] = code
+        codes[i] = code
+    return codes, vocab
+
+
+def _set_anomalies(df_anomalies: Optional[pd.DataFrame]) -> None:
+    """Store Isolation Forest results and align them with satellites_tle."""
+    _state["df_anomalies"] = df_anomalies
+    _state["n_anomalies"] = (
+        int(df_anomalies["is_anomaly"].sum()) if df_anomalies is not None else 0
+    )
+    _align_anomaly_arrays()
+    _invalidate_positions()
+
+
+def _align_anomaly_arrays() -> None:
+    """Build anomaly score/flag arrays aligned with satellites_tle.
+
+    Done once per analysis or catalogue change, so /api/positions
+    indexes two arrays instead of converting the DataFrame to a dict
+    on every request.  Satellites missing from the analysis score 0.0.
+    """
+    df = _state.get("df_anomalies")
+    norad_ids = _state["norad_ids"]
+    if df is None:
+        _state["anomaly_score_arr"] = np.zeros(len(norad_ids), dtype=np.float64)
+        _state["is_anomaly_arr"] = np.zeros(len(norad_ids), dtype=bool)
+        return
+
+    df = df[~df.index.duplicated(keep="last")]
+    _state["anomaly_score_arr"] = (
+        df["anomaly_score"]
+        .reindex(norad_ids, fill_value=0.0)
+        .to_numpy(dtype=np.float64)
+    )
+    _state["is_anomaly_arr"] = (
+        df["is_anomaly"]
+        .reindex(norad_ids, fill_value=False)
+        .to_numpy(dtype=bool)
+    )
+
+
+def _set_report(report: Optional["AnomalyReport"]) -> None:
+    """Store the anomaly report with the indexes used for lookups.
 
-def classify_orbit(alt_km: float) -> str:
-    if alt_km < 2000:
-        return "LEO"
-    if alt_km > 35000:
-        return "GEO"
-    return "MEO"
+    Sorting once per analysis lets /api/v1/anomalies slice the top N and
+    resolve ``min_score`` with a binary search instead of re-sorting
+    every satellite on each call; the NORAD ID dict makes
+    /api/v1/satellite/{norad_id} an O(1) lookup.
+    """
+    _state["last_report"] = report
+    records = list(report.satellites) if report is not None else []
+    records.sort(key=lambda s: s.anomaly_score, reverse=True)
+    _state["sorted_anomalies"] = records
+    _state["scores_desc"] = np.array(
+        [s.anomaly_score for s in records], dtype=np.float64
+    )
+    _state["anomaly_by_norad"] = {s.norad_id: s for s in records}
 
 
 # ----------------------------------------------------------------
 # Sprint 9: Extract mean_motion & inclination from TLE/SGP4 model
 # ----------------------------------------------------------------
-def build_tle_extra_lookup(
+def build_tle_extra_arrays(
     sats: List[EarthSatellite],
-) -> Dict[int, Dict[str, float]]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """Extract mean_motion (revs/day) and inclination (degrees) directly
-    from the SGP4 TLE model for each satellite."""
-    lookup: Dict[int, Dict[str, float]] = {}
-    for sat in sats:
-        norad_id = sat.model.satnum
-        try:
-            mean_motion_revs_day = (
-                sat.model.no_kozai * 1440.0 / (2.0 * math.pi)
-            )
-            inclination_deg = math.degrees(sat.model.inclo)
-        except Exception:
-            mean_motion_revs_day = 0.0
-            inclination_deg = 0.0
-        lookup[norad_id] = {
-            "mean_motion": round(mean_motion_revs_day, 6),
-            "inclination": round(inclination_deg, 4),
-        }
-    return lookup
+    from the SGP4 TLE model, as arrays aligned with *sats*."""
+    n = len(sats)
+    no_kozai = np.fromiter(
+        (sat.model.no_kozai for sat in sats), dtype=np.float64, count=n
+    )
+    inclo = np.fromiter(
+        (sat.model.inclo for sat in sats), dtype=np.float64, count=n
+    )
+    mean_motion_revs_day = no_kozai * 1440.0 / (2.0 * math.pi)
+    inclination_deg = np.degrees(inclo)
+    # np.round scales by 10**decimals and can land one unit off in the
+    # last place; Python's correctly-rounded round() keeps the old values
+    return (
+        np.array([round(v, 6) for v in mean_motion_revs_day.tolist()]),
+        np.array([round(v, 4) for v in inclination_deg.tolist()]),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -230,6 +424,29 @@ class PositionsResponse(BaseModel):
     satellites: List[SatellitePosition]
 
 
+class SatellitePositionColumns(BaseModel):
+    """``layout=columns``: one array per SatellitePosition field."""
+
+    name: List[str] = Field(..., examples=[["ISS (ZARYA)"]])
+    norad_id: List[int] = Field(..., examples=[[25544]])
+    lat: List[float] = Field(..., examples=[[51.64]])
+    lon: List[float] = Field(..., examples=[[0.12]])
+    alt: List[float] = Field(..., examples=[[408.0]])
+    orbit_type: List[str] = Field(..., examples=[["LEO"]])
+    anomaly_score: List[float] = Field(..., examples=[[0.12]])
+    is_anomaly: List[bool] = Field(..., examples=[[False]])
+    owner: List[str] = Field(..., examples=[["US"]])
+    object_type: List[str] = Field(..., examples=[["PAYLOAD"]])
+    mean_motion: List[float] = Field(..., examples=[[15.49]])
+    inclination: List[float] = Field(..., examples=[[51.6442]])
+
+
+class PositionsColumnsResponse(BaseModel):
+    timestamp: float = Field(..., examples=[1709136000.0])
+    total_satellites: int = Field(..., examples=[10000])
+    satellites: SatellitePositionColumns
+
+
 class SatelliteAnomaly(BaseModel):
     name: str = Field(..., examples=["ISS (ZARYA)"])
     norad_id: int = Field(..., examples=[25544])
@@ -250,12 +467,78 @@ class AnomalyReport(BaseModel):
     satellites: List[SatelliteAnomaly]
 
 
+class SatelliteBatchResponse(BaseModel):
+    satellites: List[SatelliteAnomaly]
+    missing: List[int] = Field(..., examples=[[99999]])
+
+
 class IngestResponse(BaseModel):
     status: str = Field(..., examples=["ok"])
     file_path: str = Field(..., examples=["data/active_satellites.txt"])
     satellite_count: int = Field(..., examples=[9000])
 
 
+def _build_anomaly_records(df: pd.DataFrame) -> List[SatelliteAnomaly]:
+    """Turn Isolation Forest results into ``SatelliteAnomaly`` records.
+
+    Columns are pulled out once as Python lists instead of boxing every
+    row with ``iterrows``, and ``model_construct`` skips re-validating
+    values produced by our own pipeline.
+    """
+    columns = zip(
+        df["name"].tolist(),
+        df.index.tolist(),
+        df["inclination"].tolist(),
+        df["eccentricity"].tolist(),
+        df["mean_motion"].tolist(),
+        df["bstar"].tolist(),
+        df["is_anomaly"].tolist(),
+        df["anomaly_score"].tolist(),
+    )
+    return [
+        SatelliteAnomaly.model_construct(
+            name=name,
+            norad_id=int(norad_id),
+            inclination=round(float(inclination), 6),
+            eccentricity=round(float(eccentricity), 6),
+            mean_motion=round(float(mean_motion), 6),
+            bstar=float(bstar),
+            is_anomaly=bool(is_anomaly),
+            anomaly_score=round(float(anomaly_score), 4),
+        )
+        for (
+            name,
+            norad_id,
+            inclination,
+            eccentricity,
+            mean_motion,
+            bstar,
+            is_anomaly,
+            anomaly_score,
+        ) in columns
+    ]
+
+
+def _detect_anomalies(
+    df: pd.DataFrame,
+    contamination: float,
+    detector: Optional[OrbitalAnomalyDetector] = None,
+) -> Tuple[OrbitalAnomalyDetector, pd.DataFrame, List[SatelliteAnomaly]]:
+    """Score *df* with the Isolation Forest and build the report records.
+
+    Fits a new detector unless an already-trained *detector* is given,
+    in which case it only re-scores.  CPU-bound and free of ``_state``
+    writes, so callers run it through ``asyncio.to_thread`` and publish
+    the results afterwards.
+    """
+    if detector is None:
+        detector = OrbitalAnomalyDetector(contamination=contamination)
+        df_result = detector.fit_predict(df)
+    else:
+        df_result = detector.predict(df)
+    return detector, df_result, _build_anomaly_records(df_result)
+
+
 # --------------------------------------------------------------------------
 # Sprint 14: Robust multi-source TLE download with merge, dedup,
 # redirect detection, rate-limit delay, and cache fallback.
@@ -389,7 +672,9 @@ def _parse_satcat_records(records: list) -> Dict[int, Dict[str, str]]:
     """Parse a list of CelesTrak SATCAT JSON records into a lookup dict.
 
     Sprint 12: normalises OBJECT_TYPE abbreviations (PAY -> PAYLOAD, etc.)
-    so that the frontend dropdown values match.
+    so that the frontend dropdown values match.  Owner and object type
+    take only a few dozen distinct values, so they are interned: every
+    record shares one string object per value.
     """
     lookup: Dict[int, Dict[str, str]] = {}
     for rec in records:
@@ -403,8 +688,8 @@ def _parse_satcat_records(records: list) -> Dict[int, Dict[str, str]]:
         owner = rec.get("OWNER", "UNKNOWN") or "UNKNOWN"
         obj_type_raw = rec.get("OBJECT_TYPE", "UNKNOWN") or "UNKNOWN"
         lookup[norad_id] = {
-            "owner": owner.strip(),
-            "object_type": normalise_object_type(obj_type_raw),
+            "owner": sys.intern(owner.strip()),
+            "object_type": sys.intern(normalise_object_type(obj_type_raw)),
         }
     return lookup
 
@@ -460,7 +745,7 @@ def fetch_satcat(data_dir: Path) -> Dict[int, Dict[str, str]]:
                         )
                         continue
 
-                    records = resp.json()
+                    records = orjson.loads(resp.content)
 
                     if not isinstance(records, list) or len(records) == 0:
                         logger.warning(
@@ -517,10 +802,7 @@ def fetch_satcat(data_dir: Path) -> Dict[int, Dict[str, str]]:
 
         # Persist cache for future fallback
         try:
-            cache_path.write_text(
-                json.dumps(all_records, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            cache_path.write_bytes(orjson.dumps(all_records))
             logger.info("SATCAT cache saved to %s", cache_path)
         except Exception as cache_exc:
             logger.warning("Could not save SATCAT cache: %s", cache_exc)
@@ -531,7 +813,7 @@ def fetch_satcat(data_dir: Path) -> Dict[int, Dict[str, str]]:
     logger.warning("All SATCAT downloads failed — checking cache...")
     if cache_path.exists():
         try:
-            records = json.loads(cache_path.read_text(encoding="utf-8"))
+            records = orjson.loads(cache_path.read_bytes())
             lookup = _parse_satcat_records(records)
             logger.warning("Using CACHED SATCAT: %d records", len(lookup))
             return lookup
@@ -545,6 +827,36 @@ def fetch_satcat(data_dir: Path) -> Dict[int, Dict[str, str]]:
     return {}
 
 
+def _tle_file_key(data_dir: Path) -> Tuple[str, int, int]:
+    """Return (resolved path, mtime_ns, size) of the TLE file in *data_dir*.
+
+    Keys the analyse caches: an unchanged file gives the same key.
+    Raises FileNotFoundError if the file is missing.
+    """
+    tle_path = data_dir / TLE_FILENAME
+    tle_stat = tle_path.stat()
+    return str(tle_path.resolve()), tle_stat.st_mtime_ns, tle_stat.st_size
+
+
+async def _refresh_tle_periodically() -> None:
+    """Re-download and reload the TLE catalogue every refresh interval.
+
+    Failures are logged and the current catalogue is kept; the task only
+    ends when cancelled at shutdown.
+    """
+    while True:
+        await asyncio.sleep(TLE_REFRESH_INTERVAL_S)
+        try:
+            await asyncio.to_thread(download_tle_robust, DEFAULT_DATA_DIR)
+            sats = await asyncio.to_thread(
+                load_tle_objects, data_dir=DEFAULT_DATA_DIR
+            )
+            _set_satellites(sats)
+            logger.info("TLE refresh: %d satellites loaded.", len(sats))
+        except Exception as exc:
+            logger.error("TLE refresh failed, keeping catalogue: %s", exc)
+
+
 # --------------------------------------------------------------------------
 # Sprint 11: Robust Lifespan -- never crashes, graceful degradation
 # --------------------------------------------------------------------------
@@ -555,28 +867,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Data directory: %s", DEFAULT_DATA_DIR)
     logger.info("=" * 60)
     try:
+        # SATCAT (step 2) is independent of the TLE file: fetch it in a
+        # worker thread while the TLE catalogue downloads and parses
+        satcat_task = asyncio.create_task(
+            asyncio.to_thread(fetch_satcat, data_dir=DEFAULT_DATA_DIR)
+        )
+
         # --- Step 1: Download / load TLE data ---
         logger.info("[1/5] Downloading TLE satellite catalogue (multi-source)...")
         try:
-            download_tle_robust(data_dir=DEFAULT_DATA_DIR)
+            await asyncio.to_thread(download_tle_robust, data_dir=DEFAULT_DATA_DIR)
         except FileNotFoundError as tle_exc:
             logger.error("TLE download + cache miss: %s", tle_exc)
 
         # Try loading whatever file we have (fresh or cached)
         try:
-            sats = load_tle_objects(data_dir=DEFAULT_DATA_DIR)
+            sats = await asyncio.to_thread(
+                load_tle_objects, data_dir=DEFAULT_DATA_DIR
+            )
             logger.info("Loaded %d satellites from TLE file.", len(sats))
+            tle_key = _tle_file_key(DEFAULT_DATA_DIR)
         except FileNotFoundError:
             logger.error(
                 "No TLE file available at all. "
                 "Starting with 0 satellites -- UI will display an empty globe."
             )
             sats = []
-        _state["satellites_tle"] = sats
+        _set_satellites(sats)
 
         # --- Step 2: Download / load SATCAT ---
-        logger.info("[2/5] Downloading SATCAT (owner & object type)...")
-        _state["satcat_lookup"] = fetch_satcat(data_dir=DEFAULT_DATA_DIR)
+        logger.info("[2/5] Waiting for SATCAT (owner & object type)...")
+        _state["satcat_lookup"] = await satcat_task
 
         # --- Sprint 14: Log debris / rocket body counts for verification ---
         satcat = _state["satcat_lookup"]
@@ -608,55 +929,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             rb_with_tle,
         )
 
-        # --- Step 3: Build TLE extra lookup ---
-        logger.info(
-            "[3/5] Building TLE extra lookup (mean_motion & inclination)..."
-        )
-        _state["tle_extra_lookup"] = build_tle_extra_lookup(sats)
-        logger.info(
-            "TLE extra lookup built: %d entries.",
-            len(_state["tle_extra_lookup"]),
-        )
+        # --- Step 3: Align SATCAT metadata with the TLE catalogue ---
+        # (mean_motion & inclination come from the SGP4 records, already
+        # extracted by _set_satellites)
+        logger.info("[3/5] Aligning SATCAT metadata with TLE catalogue...")
+        _align_satellite_metadata()
 
         # --- Steps 4 & 5: Feature extraction + ML (only if we have data) ---
         if sats:
             logger.info("[4/5] Extracting orbital features...")
-            df = extract_features(sats)
+            df = await asyncio.to_thread(extract_features, sats)
+            # A later /api/v1/analyse of the same file skips re-parsing
+            _features_cache[tle_key] = (sats, df)
 
             logger.info("[5/5] Training Isolation Forest...")
-            detector = OrbitalAnomalyDetector(contamination=0.05)
-            df_anomalies = detector.fit_predict(df)
-            _state["df_anomalies"] = df_anomalies
+            detector, df_anomalies, records = await asyncio.to_thread(
+                _detect_anomalies, df, 0.05
+            )
+            _analysis_cache[(*tle_key, 0.05)] = (
+                sats, detector, df_anomalies, records
+            )
+            _set_anomalies(df_anomalies)
             _state["detector"] = detector
 
-            n_anomalies = int(df_anomalies["is_anomaly"].sum())
-            records: List[SatelliteAnomaly] = []
-            for norad_id, row in df_anomalies.iterrows():
-                records.append(
-                    SatelliteAnomaly(
-                        name=row["name"],
-                        norad_id=int(norad_id),
-                        inclination=round(
-                            float(row["inclination"]), 6
-                        ),
-                        eccentricity=round(
-                            float(row["eccentricity"]), 6
-                        ),
-                        mean_motion=round(
-                            float(row["mean_motion"]), 6
-                        ),
-                        bstar=float(row["bstar"]),
-                        is_anomaly=bool(row["is_anomaly"]),
-                        anomaly_score=round(
-                            float(row["anomaly_score"]), 4
-                        ),
-                    )
+            n_anomalies = _state["n_anomalies"]
+            _set_report(
+                AnomalyReport(
+                    total_satellites=len(df_anomalies),
+                    total_anomalies=n_anomalies,
+                    contamination_rate=0.05,
+                    satellites=records,
                 )
-            _state["last_report"] = AnomalyReport(
-                total_satellites=len(df_anomalies),
-                total_anomalies=n_anomalies,
-                contamination_rate=0.05,
-                satellites=records,
             )
             logger.info(
                 "READY: %d satellites, %d anomalies, SATCAT entries: %d, "
@@ -685,15 +988,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "all endpoints will return empty/default data."
         )
 
+    refresh_task = asyncio.create_task(_refresh_tle_periodically())
+
     yield
 
     # --- Shutdown cleanup ---
-    _state["satellites_tle"] = []
-    _state["df_anomalies"] = None
+    refresh_task.cancel()
+    _analysis_cache.clear()
+    _features_cache.clear()
+    _set_satellites([])
+    _set_anomalies(None)
     _state["detector"] = None
-    _state["last_report"] = None
+    _set_report(None)
     _state["satcat_lookup"] = {}
-    _state["tle_extra_lookup"] = {}
     logger.info("Shutdown complete.")
 
 
@@ -708,6 +1015,8 @@ app = FastAPI(
     ),
     version="1.4.0",
     lifespan=lifespan,
+    # orjson instead of json.dumps for every model-validated response
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -717,6 +1026,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# The positions payload (~14k objects of repeated keys/strings) compresses
+# 5-10x; small responses stay uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
 
 app.mount(
     "/static",
@@ -736,22 +1048,249 @@ async def index(request: Request):
 
 @app.get("/health", response_model=HealthResponse, tags=["system"])
 async def health() -> HealthResponse:
-    df = _state.get("df_anomalies")
-    n_anomalies = int(df["is_anomaly"].sum()) if df is not None else 0
     return HealthResponse(
         status="ok",
         version="1.4.0",
         satellites_loaded=len(_state.get("satellites_tle", [])),
-        anomalies_detected=n_anomalies,
+        anomalies_detected=_state["n_anomalies"],
+    )
+
+
+# ----------------------------------------------------------------
+# Positions payload, cached per propagation tick
+# ----------------------------------------------------------------
+def _subpoints_at_tick(
+    bucket: int,
+    satrec_array: SatrecArray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (lat, lon, alt) for *satrec_array*, propagated once per tick.
+
+    ``ts.now()`` and the batched SGP4 call run on the first request of a
+    tick; later requests in the same tick reuse the arrays whatever
+    their filters.  The arrays are keyed on the SatrecArray too, so a
+    build still running on a replaced catalogue never serves the new one.
+    """
+    global _tick_subpoints
+    if (
+        _tick_subpoints is None
+        or _tick_subpoints[0] != bucket
+        or _tick_subpoints[1] is not satrec_array
+    ):
+        lats, lons, alts = propagate_subpoints(satrec_array, ts.now())
+        _tick_subpoints = (bucket, satrec_array, lats, lons, alts)
+    return _tick_subpoints[2:]
+
+
+def _build_positions_payload(
+    state: Dict[str, Any],
+    bucket: int,
+    filter_upper: str,
+    owner_filter_upper: Optional[str],
+    object_type_filter_upper: Optional[str],
+    columnar: bool = False,
+) -> bytes:
+    """Propagate, enrich and filter the catalogue into orjson bytes.
+
+    The payload is built from plain dicts rather than per-satellite
+    Pydantic models; ``PositionsResponse`` documents its schema.  With
+    *columnar*, ``satellites`` is instead one list per field.
+
+    *state* is a snapshot of ``_state`` taken on the event loop, so a
+    catalogue swap during the build cannot mix old and new arrays.
+    """
+    satellites = state.get("satellites_tle", [])
+
+    # Sprint 11: return empty list instead of 503 when in degraded mode
+    if not satellites:
+        return orjson.dumps(
+            {
+                "timestamp": time.time(),
+                "total_satellites": 0,
+                "satellites": (
+                    {field: [] for field in SatellitePositionColumns.model_fields}
+                    if columnar
+                    else []
+                ),
+            }
+        )
+
+    names = state["names"]
+    norad_ids = state["norad_ids"]
+
+    owners = state["owners"]
+    object_types = state["object_types"]
+    mean_motion_arr = state["mean_motion_arr"]
+    inclination_arr = state["inclination_arr"]
+    anomaly_scores = state["anomaly_score_arr"]
+    anomaly_flags = state["is_anomaly_arr"]
+
+    # Time-invariant filters first, so an empty selection skips SGP4
+    mask = np.ones(len(satellites), dtype=bool)
+
+    # --- Strategic OSINT filters (Sprint 8 + Sprint 12 fix) ---
+    # Case-insensitive, whitespace-tolerant: values resolve to category
+    # codes once, unknown ones to -1 (matches nothing)
+    if owner_filter_upper:
+        owner_code = state["owner_vocab"].get(owner_filter_upper, -1)
+        mask &= state["owner_codes"] == owner_code
+    if object_type_filter_upper:
+        type_code = state["object_type_vocab"].get(
+            object_type_filter_upper, -1
+        )
+        mask &= state["object_type_codes"] == type_code
+
+    if filter_upper == "ANOMALIES":
+        mask &= anomaly_flags
+
+    if mask.any():
+        # Propagate the whole catalogue in one batched SGP4 call per tick
+        lats, lons, alts = _subpoints_at_tick(bucket, state["satrec_array"])
+        # Sprint 11: skip satellites with non-finite coordinates (inf/NaN)
+        mask &= np.isfinite(lats) & np.isfinite(lons) & np.isfinite(alts)
+    else:
+        lats = lons = alts = np.zeros(len(satellites))
+
+    # Classify every satellite in one pass; LEO/MEO/GEO filters are masks
+    orbit_codes = classify_orbit_codes(alts)
+    orbit_target = ORBIT_CODES.get(filter_upper)
+    if orbit_target is not None:
+        mask &= orbit_codes == orbit_target
+
+    idx = np.flatnonzero(mask)
+    scores = np.round(anomaly_scores[idx], 4)
+
+    # --- Sprint 7: TOP10 filter ---
+    # Pick the 10 highest scores before building any dicts: partition to
+    # the 10th best score, then stable-sort only the candidates so ties
+    # keep catalogue order.
+    if filter_upper == "TOP10":
+        if len(idx) > 10:
+            tenth_best = np.partition(scores, len(scores) - 10)[-10]
+            candidates = np.flatnonzero(scores >= tenth_best)
+        else:
+            candidates = np.arange(len(idx))
+        order = candidates[
+            np.argsort(-scores[candidates], kind="stable")[:10]
+        ]
+        idx = idx[order]
+        scores = scores[order]
+
+    # Round whole columns once instead of per satellite
+    columns: Dict[str, List[Any]] = {
+        "name": names[idx].tolist(),
+        "norad_id": norad_ids[idx].tolist(),
+        "lat": np.round(lats[idx], 4).tolist(),
+        "lon": np.round(lons[idx], 4).tolist(),
+        "alt": np.round(alts[idx], 2).tolist(),
+        "orbit_type": _ORBIT_LABELS[orbit_codes[idx]].tolist(),
+        "anomaly_score": scores.tolist(),
+        "is_anomaly": anomaly_flags[idx].tolist(),
+        # SATCAT enrichment (Sprint 8) & TLE extra data (Sprint 9)
+        "owner": owners[idx].tolist(),
+        "object_type": object_types[idx].tolist(),
+        "mean_motion": mean_motion_arr[idx].tolist(),
+        "inclination": inclination_arr[idx].tolist(),
+    }
+
+    positions: Any
+    if columnar:
+        positions = columns
+    else:
+        fields = tuple(columns)
+        positions = [
+            dict(zip(fields, row)) for row in zip(*columns.values())
+        ]
+
+    return orjson.dumps(
+        {
+            "timestamp": time.time(),
+            "total_satellites": len(idx),
+            "satellites": positions,
+        }
+    )
+
+
+async def _get_positions_payload(
+    filter_type: str,
+    owner: Optional[str],
+    object_type: Optional[str],
+    columnar: bool = False,
+) -> Tuple[str, bytes, Optional[bytes]]:
+    """Return ``(etag, payload, gzipped)`` for this tick, built once.
+
+    The ETag is derived from the cache key, so every response for the
+    same tick and filters carries the same validator.  ``gzipped`` is
+    None for payloads too small to be worth compressing.
+    """
+    filter_upper = filter_type.upper()
+
+    # Sprint 12 fix: pre-normalise filter values once (not per-satellite)
+    owner_filter_upper: Optional[str] = None
+    if owner and owner.strip():
+        owner_filter_upper = owner.strip().upper()
+
+    object_type_filter_upper: Optional[str] = None
+    if object_type and object_type.strip():
+        object_type_filter_upper = object_type.strip().upper()
+
+    # Clients polling within the same tick share one propagation
+    bucket = int(time.time() // POSITIONS_CACHE_TICK_S)
+    key = (
+        bucket,
+        filter_upper,
+        owner_filter_upper,
+        object_type_filter_upper,
+        columnar,
     )
+    cached = _positions_cache.get(key)
+    if cached is None:
+        async with _positions_lock:
+            cached = _positions_cache.get(key)
+            if cached is None:
+                # Snapshot on the event loop, where _set_satellites runs
+                generation = _positions_generation
+                state = dict(_state)
+                # CPU-bound; keep the event loop free for other requests
+                payload = await asyncio.to_thread(
+                    _build_positions_payload,
+                    state,
+                    bucket,
+                    filter_upper,
+                    owner_filter_upper,
+                    object_type_filter_upper,
+                    columnar,
+                )
+                # Compress once per tick rather than once per response
+                gzipped: Optional[bytes] = None
+                if len(payload) >= GZIP_MINIMUM_SIZE:
+                    gzipped = await asyncio.to_thread(
+                        gzip.compress, payload, compresslevel=6, mtime=0
+                    )
+                etag = (
+                    f'"{generation:x}-{bucket:x}-'
+                    f'{zlib.crc32(repr(key[1:]).encode()):08x}"'
+                )
+                cached = (etag, payload, gzipped)
+                # A catalogue swap during the build makes it stale: serve
+                # it to this caller only
+                if generation == _positions_generation:
+                    for stale in [
+                        k for k in _positions_cache if k[0] != bucket
+                    ]:
+                        del _positions_cache[stale]
+                    _positions_cache[key] = cached
+
+    return cached
 
 
 @app.get(
     "/api/positions",
-    response_model=PositionsResponse,
+    # layout=columns returns the PositionsColumnsResponse shape
+    response_model=Union[PositionsResponse, PositionsColumnsResponse],
     tags=["realtime"],
 )
 async def get_positions(
+    request: Request,
     filter_type: str = Query(
         default="ALL",
         description="ALL, LEO, MEO, GEO, ANOMALIES, or TOP10.",
@@ -770,125 +1309,137 @@ async def get_positions(
             "(e.g. PAYLOAD, DEBRIS, ROCKET BODY, TBA, UNKNOWN)."
         ),
     ),
-) -> PositionsResponse:
-    satellites = _state.get("satellites_tle", [])
-    df_anom = _state.get("df_anomalies")
-    satcat = _state.get("satcat_lookup", {})
-    tle_extra = _state.get("tle_extra_lookup", {})
-
-    # Sprint 11: return empty list instead of 503 when in degraded mode
-    if not satellites:
-        return PositionsResponse(
-            timestamp=time.time(),
-            total_satellites=0,
-            satellites=[],
-        )
-
-    anomaly_lookup: Dict[int, Dict[str, Any]] = {}
-    if df_anom is not None:
-        anomaly_lookup = df_anom[
-            ["anomaly_score", "is_anomaly"]
-        ].to_dict("index")
-
-    filter_upper = filter_type.upper()
-
-    # Sprint 12 fix: pre-normalise filter values once (not per-satellite)
-    owner_filter_upper: Optional[str] = None
-    if owner and owner.strip():
-        owner_filter_upper = owner.strip().upper()
-
-    object_type_filter_upper: Optional[str] = None
-    if object_type and object_type.strip():
-        object_type_filter_upper = object_type.strip().upper()
-
-    t_now = ts.now()
+    layout: str = Query(
+        default="rows",
+        pattern="^(rows|columns)$",
+        description=(
+            "rows: one object per satellite. columns: 'satellites' maps "
+            "each field to an array (smaller payload, faster to parse)."
+        ),
+    ),
+) -> Response:
+    etag, payload, gzipped = await _get_positions_payload(
+        filter_type, owner, object_type, columnar=layout == "columns"
+    )
+    headers = {
+        "Cache-Control": "public, max-age=1",
+        # The body depends on Accept-Encoding, compressed or not
+        "Vary": "Accept-Encoding",
+    }
+    # Pre-compressed body; GZipMiddleware leaves encoded responses alone.
+    # Each content-coding gets its own strong validator (RFC 9110 8.8.3)
+    if gzipped is not None and "gzip" in request.headers.get(
+        "accept-encoding", ""
+    ):
+        headers["Content-Encoding"] = "gzip"
+        etag = etag[:-1] + '-gz"'
+        payload = gzipped
+    headers["ETag"] = etag
+
+    # Pollers re-asking within the same tick get a bodyless 304
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=payload, media_type="application/json", headers=headers
+    )
 
-    positions: List[SatellitePosition] = []
-    for sat in satellites:
-        try:
-            geocentric = sat.at(t_now)
-            subpoint = wgs84.subpoint(geocentric)
-            lat = subpoint.latitude.degrees
-            lon = subpoint.longitude.degrees
-            alt = subpoint.elevation.km
-        except Exception:
-            continue
 
-        # Sprint 11: skip satellites with non-finite coordinates (inf/NaN)
-        if not (
-            math.isfinite(lat)
-            and math.isfinite(lon)
-            and math.isfinite(alt)
-        ):
-            continue
+@app.websocket("/ws/positions")
+async def stream_positions(
+    websocket: WebSocket,
+    filter_type: str = Query(default="ALL"),
+    owner: Optional[str] = Query(default=None),
+    object_type: Optional[str] = Query(default=None),
+    interval: float = Query(default=5.0, ge=POSITIONS_CACHE_TICK_S, le=60.0),
+) -> None:
+    """Push the /api/positions payload every *interval* seconds.
 
-        norad_id = sat.model.satnum
-        orbit_type = classify_orbit(alt)
+    Same filters and JSON as the HTTP endpoint, sent as binary frames of
+    the cached orjson bytes; frames come from the shared per-tick cache,
+    so streaming clients cost no extra propagation or encoding.
+    """
+    await websocket.accept()
+    try:
+        while True:
+            _, payload, _ = await _get_positions_payload(
+                filter_type, owner, object_type
+            )
+            await websocket.send_bytes(payload)
+            await asyncio.sleep(interval)
+    except WebSocketDisconnect:
+        pass
 
-        anom_data = anomaly_lookup.get(norad_id)
-        if anom_data is not None:
-            score = float(anom_data["anomaly_score"])
-            flagged = bool(anom_data["is_anomaly"])
-        else:
-            score = 0.0
-            flagged = False
 
-        # SATCAT enrichment (Sprint 8, normalised in Sprint 12)
-        sat_meta = satcat.get(norad_id, {})
-        sat_owner = sat_meta.get("owner", "UNKNOWN")
-        sat_object_type = sat_meta.get("object_type", "UNKNOWN")
+@app.get(
+    "/api/v1/anomalies",
+    response_model=List[SatelliteAnomaly],
+    tags=["anomalies"],
+)
+async def get_anomalies(
+    top_n: int = Query(default=10, ge=1),
+    min_score: Optional[float] = Query(default=None, ge=0.0, le=1.0),
+) -> List[SatelliteAnomaly]:
+    if _state.get("last_report") is None:
+        raise HTTPException(
+            status_code=404,
+            detail="No anomaly report available yet.",
+        )
 
-        # Sprint 9: TLE extra data (mean_motion & inclination)
-        tle_data = tle_extra.get(norad_id, {})
-        sat_mean_motion = tle_data.get("mean_motion", 0.0)
-        sat_inclination = tle_data.get("inclination", 0.0)
+    sorted_anomalies: List[SatelliteAnomaly] = _state["sorted_anomalies"]
+    end = len(sorted_anomalies)
+    if min_score is not None:
+        # Scores are sorted descending: count those >= min_score
+        end = int(
+            np.searchsorted(-_state["scores_desc"], -min_score, side="right")
+        )
+    return sorted_anomalies[: min(top_n, end)]
 
-        # --- Orbit / anomaly filters ---
-        if filter_upper == "LEO" and orbit_type != "LEO":
-            continue
-        if filter_upper == "MEO" and orbit_type != "MEO":
-            continue
-        if filter_upper == "GEO" and orbit_type != "GEO":
-            continue
-        if filter_upper == "ANOMALIES" and not flagged:
-            continue
 
-        # --- Strategic OSINT filters (Sprint 8 + Sprint 12 fix) ---
-        # Case-insensitive, whitespace-tolerant comparisons
-        if owner_filter_upper:
-            if sat_owner.strip().upper() != owner_filter_upper:
-                continue
-        if object_type_filter_upper:
-            if sat_object_type.strip().upper() != object_type_filter_upper:
-                continue
-
-        positions.append(
-            SatellitePosition(
-                name=sat.name,
-                norad_id=norad_id,
-                lat=round(lat, 4),
-                lon=round(lon, 4),
-                alt=round(alt, 2),
-                orbit_type=orbit_type,
-                anomaly_score=round(score, 4),
-                is_anomaly=flagged,
-                owner=sat_owner,
-                object_type=sat_object_type,
-                mean_motion=sat_mean_motion,
-                inclination=sat_inclination,
-            )
+@app.get(
+    "/api/v1/satellite/{norad_id}",
+    response_model=SatelliteAnomaly,
+    tags=["anomalies"],
+)
+async def get_satellite(norad_id: int) -> SatelliteAnomaly:
+    sat = _state.get("anomaly_by_norad", {}).get(norad_id)
+    if sat is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Satellite {norad_id} not found.",
         )
+    return sat
 
-    # --- Sprint 7: TOP10 filter ---
-    if filter_upper == "TOP10":
-        positions.sort(key=lambda p: p.anomaly_score, reverse=True)
-        positions = positions[:10]
 
-    return PositionsResponse(
-        timestamp=time.time(),
-        total_satellites=len(positions),
-        satellites=positions,
-    )
+@app.post(
+    "/api/v1/satellites/batch",
+    response_model=SatelliteBatchResponse,
+    tags=["anomalies"],
+)
+async def get_satellites_batch(
+    norad_ids: List[int] = Body(
+        ...,
+        min_length=1,
+        max_length=SATELLITE_BATCH_MAX,
+        examples=[[25544, 48274]],
+    ),
+) -> SatelliteBatchResponse:
+    """Look up many NORAD IDs in one round trip (100-1 000 per call).
+
+    IDs without a record (unknown, or no analysis yet) are listed in
+    ``missing`` rather than failing the whole batch.
+    """
+    by_norad = _state.get("anomaly_by_norad", {})
+    found: List[SatelliteAnomaly] = []
+    missing: List[int] = []
+    for norad_id in norad_ids:
+        sat = by_norad.get(norad_id)
+        if sat is None:
+            missing.append(norad_id)
+        else:
+            found.append(sat)
+    return SatelliteBatchResponse(satellites=found, missing=missing)
 
 
 @app.post(
@@ -901,9 +1452,10 @@ async def ingest_tle(
 ) -> IngestResponse:
     try:
         dir_path = Path(data_dir)
-        result_path = fetch_tle_data(data_dir=dir_path)
-        satellites = load_tle_objects(data_dir=dir_path)
-        _state["satellites_tle"] = satellites
+        # Async download; TLE parsing is CPU-bound, so it gets a thread
+        result_path = await fetch_tle_data_async(data_dir=dir_path)
+        satellites = await asyncio.to_thread(load_tle_objects, data_dir=dir_path)
+        _set_satellites(satellites)
         return IngestResponse(
             status="ok",
             file_path=str(result_path),
@@ -924,45 +1476,78 @@ async def ingest_tle(
 async def analyse(
     data_dir: str = Query(default="data"),
     contamination: float = Query(default=0.05, ge=0.001, le=0.5),
+    refit: bool = Query(
+        default=True,
+        description=(
+            "Retrain the Isolation Forest. With false, the current model "
+            "re-scores the catalogue (same contamination only)."
+        ),
+    ),
 ) -> AnomalyReport:
     try:
-        satellites = load_tle_objects(data_dir=Path(data_dir))
-        _state["satellites_tle"] = satellites
-
-        df = extract_features(satellites)
-        if df.empty:
-            raise HTTPException(
-                status_code=422,
-                detail="No satellites could be parsed.",
+        # Same TLE file + contamination -> same fitted model (fixed
+        # random_state), so a repeated analysis reuses the previous fit.
+        # Only real fits are cached; a refit=false re-score uses it only
+        # if the cached model is the one currently loaded.
+        file_key = _tle_file_key(Path(data_dir))
+        cache_key = (*file_key, contamination)
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None and (
+            refit or cached[1] is _state.get("detector")
+        ):
+            satellites, detector, df_result, records = cached
+            if _state["satellites_tle"] is not satellites:
+                _set_satellites(satellites)
+        else:
+            # Unchanged file: skip Skyfield parsing and feature extraction
+            features = _features_cache.get(file_key)
+            if features is not None:
+                satellites, df = features
+            else:
+                satellites = await asyncio.to_thread(
+                    load_tle_objects, data_dir=Path(data_dir)
+                )
+                df = await asyncio.to_thread(extract_features, satellites)
+                _features_cache.clear()
+                _features_cache[file_key] = (satellites, df)
+            if _state["satellites_tle"] is not satellites:
+                _set_satellites(satellites)
+
+            if df.empty:
+                raise HTTPException(
+                    status_code=422,
+                    detail="No satellites could be parsed.",
+                )
+
+            # Re-scoring with the trained model skips the fit entirely
+            previous = _state.get("detector")
+            if (
+                refit
+                or previous is None
+                or previous.model.contamination != contamination
+            ):
+                previous = None
+
+            # Training takes ~0.5 s on a full catalogue; keep serving meanwhile
+            detector, df_result, records = await asyncio.to_thread(
+                _detect_anomalies, df, contamination, previous
             )
+            if previous is None:
+                _analysis_cache.clear()
+                _analysis_cache[cache_key] = (
+                    satellites, detector, df_result, records
+                )
 
-        detector = OrbitalAnomalyDetector(contamination=contamination)
-        df_result = detector.fit_predict(df)
-        _state["df_anomalies"] = df_result
+        _set_anomalies(df_result)
         _state["detector"] = detector
 
-        records: List[SatelliteAnomaly] = []
-        for norad_id, row in df_result.iterrows():
-            records.append(
-                SatelliteAnomaly(
-                    name=row["name"],
-                    norad_id=int(norad_id),
-                    inclination=round(float(row["inclination"]), 6),
-                    eccentricity=round(float(row["eccentricity"]), 6),
-                    mean_motion=round(float(row["mean_motion"]), 6),
-                    bstar=float(row["bstar"]),
-                    is_anomaly=bool(row["is_anomaly"]),
-                    anomaly_score=round(float(row["anomaly_score"]), 4),
-                )
-            )
-
         report = AnomalyReport(
             total_satellites=len(df_result),
-            total_anomalies=int(df_result["is_anomaly"].sum()),
+            total_anomalies=_state["n_anomalies"],
             contamination_rate=contamination,
             satellites=records,
         )
-        _state["last_report"] = report
+        _set_report(report)
         return report
 
     except FileNotFoundError as exc:
@@ -46,6 +46,28 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def _feature_matrix(
+    df: pd.DataFrame,
+    features: List[str],
+) -> np.ndarray:
+    """Return *features* of *df* as one contiguous float32 matrix.
+
+    The trees work in float32 anyway, so scaling in float32 means
+    neither ``fit()`` nor ``decision_function()`` converts its own copy.
+
+    Raises:
+        ValueError: If any of the requested *features* are missing.
+    """
+    missing: List[str] = [
+        f for f in features if f not in df.columns
+    ]
+    if missing:
+        raise ValueError(
+            f"Missing required features in DataFrame: {missing}"
+        )
+    return np.ascontiguousarray(df[features].to_numpy(dtype=np.float32))
+
+
 class OrbitalAnomalyDetector:
     """Detect orbital anomalies using an Isolation Forest model.
 
@@ -75,6 +97,7 @@ class OrbitalAnomalyDetector:
         self.model: IsolationForest = IsolationForest(
             contamination=contamination,
             random_state=random_state,
+            n_jobs=-1,
         )
         self.is_trained: bool = False
 
@@ -103,27 +126,65 @@ class OrbitalAnomalyDetector:
             ValueError: If any of the requested *features* are
                 missing from *df*.
         """
-        missing: List[str] = [
-            f for f in features if f not in df.columns
-        ]
-        if missing:
-            raise ValueError(
-                f"Missing required features in DataFrame: {missing}"
-            )
-
-        x: np.ndarray = df[features].values
-        x_scaled: np.ndarray = self.scaler.fit_transform(x)
+        x_scaled: np.ndarray = self.scaler.fit_transform(
+            _feature_matrix(df, features)
+        )
 
         logger.info("Training Isolation Forest...")
         self.model.fit(x_scaled)
+        self.is_trained = True
+
+        return self._score(df, x_scaled)
+
+    def predict(
+        self,
+        df: pd.DataFrame,
+        features: List[str] = FEATURES_TO_USE,
+    ) -> pd.DataFrame:
+        """Score every satellite with the already-fitted model.
+
+        Same output as :meth:`fit_predict`, but reuses the fitted
+        scaler and forest instead of training again, which is much
+        cheaper when only the TLE values have moved.
+
+        Args:
+            df: DataFrame produced by
+                :func:`orbit_intel.dynamics.extract_features`.
+            features: Column names to use as model inputs.
+
+        Returns:
+            A copy of *df* with ``is_anomaly`` and ``anomaly_score``
+            columns added.
 
+        Raises:
+            RuntimeError: If the detector has not been fitted yet.
+            ValueError: If any of the requested *features* are
+                missing from *df*.
+        """
+        if not self.is_trained:
+            raise RuntimeError("Detector has not been fitted yet.")
+
+        x_scaled: np.ndarray = self.scaler.transform(
+            _feature_matrix(df, features)
+        )
+        return self._score(df, x_scaled)
+
+    def _score(
+        self,
+        df: pd.DataFrame,
+        x_scaled: np.ndarray,
+    ) -> pd.DataFrame:
+        """Append ``is_anomaly`` / ``anomaly_score`` for *x_scaled* rows."""
         raw_scores: np.ndarray = self.model.decision_function(
             x_scaled
         )
-        predictions: np.ndarray = self.model.predict(x_scaled)
 
-        df_result: pd.DataFrame = df.copy()
-        df_result["is_anomaly"] = predictions == -1
+        # predict() is decision_function() < 0; reuse the scores rather
+        # than walking every tree a second time.  A shallow copy shares
+        # the feature columns with *df*; only the two new columns are
+        # allocated, and *df* itself is left untouched.
+        df_result: pd.DataFrame = df.copy(deep=False)
+        df_result["is_anomaly"] = raw_scores < 0
 
         # Invert scores so higher means more anomalous
         inverted_scores: np.ndarray = -raw_scores
@@ -142,8 +203,6 @@ class OrbitalAnomalyDetector:
             normalized_scores, 0.0, 1.0
         )
 
-        self.is_trained = True
-
         n_anomalies: int = int(df_result["is_anomaly"].sum())
         logger.info(
             "Found %d anomalies out of %d satellites",
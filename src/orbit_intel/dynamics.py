@@ -9,14 +9,17 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
 from skyfield.api import EarthSatellite, load
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_DATA_DIR: Path = Path("data")
+UNIX_EPOCH_JD: float = 2440587.5
+SECONDS_PER_DAY: float = 86400.0
 TLE_FILENAME: str = "active_satellites.txt"
 
 
@@ -74,22 +77,24 @@ def extract_features(
     Returns:
         DataFrame indexed by norad_id with orbital feature columns.
     """
-    records: List[Dict[str, Any]] = []
+    names: List[str] = []
+    rows: List[Tuple[float, ...]] = []
 
     for sat in satellites:
         try:
-            record: Dict[str, Any] = {
-                "name": sat.name,
-                "norad_id": sat.model.satnum,
-                "inclination": sat.model.inclo,
-                "eccentricity": sat.model.ecco,
-                "mean_motion": sat.model.no_kozai,
-                "bstar": sat.model.bstar,
-                "epoch_days": (
-                    sat.epoch.utc_datetime().timestamp()
-                ),
-            }
-            records.append(record)
+            model = sat.model
+            rows.append(
+                (
+                    model.satnum,
+                    model.inclo,
+                    model.ecco,
+                    model.no_kozai,
+                    model.bstar,
+                    model.jdsatepoch,
+                    model.jdsatepochF,
+                )
+            )
+            names.append(sat.name)
         except Exception as exc:  # noqa: BLE001
             logger.warning(
                 "Skipping satellite %s: %s",
@@ -97,10 +102,26 @@ def extract_features(
                 exc,
             )
 
-    df: pd.DataFrame = pd.DataFrame(records)
-
-    if not df.empty:
-        df = df.set_index("norad_id")
+    if not rows:
+        df: pd.DataFrame = pd.DataFrame()
+    else:
+        # One float64 matrix, sliced into columns (no per-row dicts)
+        values: np.ndarray = np.array(rows, dtype=np.float64)
+        # TLE epochs are UTC Julian dates; convert to Unix seconds at once
+        epoch_seconds: np.ndarray = (
+            (values[:, 5] - UNIX_EPOCH_JD) + values[:, 6]
+        ) * SECONDS_PER_DAY
+        df = pd.DataFrame(
+            {
+                "name": names,
+                "inclination": values[:, 1],
+                "eccentricity": values[:, 2],
+                "mean_motion": values[:, 3],
+                "bstar": values[:, 4],
+                "epoch_days": epoch_seconds,
+            },
+            index=pd.Index(values[:, 0].astype(np.int64), name="norad_id"),
+        )
 
     logger.info("Extracted features for %d satellites", len(df))
     return df
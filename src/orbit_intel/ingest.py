@@ -11,6 +11,7 @@ import sys
 import tempfile
 from pathlib import Path
 
+import httpx
 import requests
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,7 @@ CELESTRAK_ACTIVE_URL: str = (
 DEFAULT_DATA_DIR: Path = Path("data")
 TLE_FILENAME: str = "active_satellites.txt"
 REQUEST_TIMEOUT: int = 15
+DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -70,17 +72,17 @@ def fetch_tle_data(
         )
         response.raise_for_status()
 
+        # TLE text is plain ASCII: copy raw bytes in large chunks rather
+        # than decoding and re-joining it line by line
         with tempfile.NamedTemporaryFile(
             delete=False,
-            mode="w",
-            encoding="utf-8",
+            mode="wb",
             suffix=".tle.tmp",
             dir=str(data_dir),
         ) as tmp_file:
             tmp_path = tmp_file.name
-            for line in response.iter_lines(decode_unicode=True):
-                if line is not None:
-                    tmp_file.write(line + "\n")
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                tmp_file.write(chunk)
 
         logger.debug("Temporary file written to %s", tmp_path)
 
@@ -111,6 +113,81 @@ def fetch_tle_data(
                 )
 
 
+async def fetch_tle_data_async(
+    data_dir: Path,
+    url: str = CELESTRAK_ACTIVE_URL,
+) -> Path:
+    """Non-blocking variant of :func:`fetch_tle_data` for the API.
+
+    Streams the response through ``httpx.AsyncClient`` so the event loop
+    keeps serving while the catalogue downloads, with the same atomic
+    temporary-file write.
+
+    Args:
+        data_dir: Directory where TLE data will be stored.
+        url: URL to fetch TLE data from.
+
+    Returns:
+        Path to the saved TLE file.
+
+    Raises:
+        RuntimeError: If the download fails due to network issues.
+    """
+    data_dir.mkdir(parents=True, exist_ok=True)
+    final_path: Path = data_dir / TLE_FILENAME
+
+    logger.info("Downloading TLE data from %s ...", url)
+
+    tmp_path: str = ""
+    try:
+        async with httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            follow_redirects=True,
+        ) as client:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                with tempfile.NamedTemporaryFile(
+                    delete=False,
+                    mode="wb",
+                    suffix=".tle.tmp",
+                    dir=str(data_dir),
+                ) as tmp_file:
+                    tmp_path = tmp_file.name
+                    async for chunk in response.aiter_bytes(
+                        DOWNLOAD_CHUNK_SIZE
+                    ):
+                        tmp_file.write(chunk)
+
+        logger.debug("Temporary file written to %s", tmp_path)
+
+        shutil.move(tmp_path, str(final_path))
+        tmp_path = ""
+
+        logger.info(
+            "Successfully saved TLE data to %s", final_path
+        )
+        return final_path
+
+    except httpx.HTTPError as exc:
+        logger.critical(
+            "Failed to download TLE data: %s", exc
+        )
+        raise RuntimeError(
+            f"TLE download failed: {exc}"
+        ) from exc
+
+    finally:
+        if tmp_path:
+            tmp_file_path = Path(tmp_path)
+            if tmp_file_path.exists():
+                tmp_file_path.unlink()
+                logger.debug(
+                    "Cleaned up temporary file %s",
+                    tmp_path,
+                )
+
+
 def main() -> None:
     """Entry point for the TLE ingestion CLI."""
     parser = argparse.ArgumentParser(
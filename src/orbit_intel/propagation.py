@@ -0,0 +1,121 @@
+"""Batched SGP4 propagation module — whole-catalogue sub-points in one pass.
+
+Stacks the SGP4 records of every loaded satellite into a single
+``SatrecArray`` so that one C-level call propagates the full catalogue,
+rotates the TEME vectors into the Earth-fixed frame with a single GMST
+rotation, and converts them to geodetic latitude, longitude and altitude
+with a vectorised WGS84 (Bowring) kernel.
+"""
+
+import logging
+from typing import List, Tuple
+
+import numpy as np
+from sgp4.api import SatrecArray
+from skyfield.api import EarthSatellite, wgs84
+from skyfield.constants import DAY_S
+from skyfield.sgp4lib import theta_GMST1982
+from skyfield.timelib import Time
+
+logger = logging.getLogger(__name__)
+
+# WGS84 ellipsoid (km)
+WGS84_A_KM = wgs84.radius.km
+WGS84_F = 1.0 / wgs84.inverse_flattening
+WGS84_B_KM = WGS84_A_KM * (1.0 - WGS84_F)
+WGS84_E2 = WGS84_F * (2.0 - WGS84_F)
+WGS84_EP2 = WGS84_E2 / (1.0 - WGS84_E2)
+
+
+def build_satrec_array(satellites: List[EarthSatellite]) -> SatrecArray:
+    """Stack the SGP4 records of *satellites* into a ``SatrecArray``.
+
+    Args:
+        satellites: List of EarthSatellite objects.
+
+    Returns:
+        A ``SatrecArray`` whose rows follow the order of *satellites*.
+    """
+    return SatrecArray([sat.model for sat in satellites])
+
+
+def ecef_to_geodetic(
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert Earth-fixed cartesian coordinates to WGS84 geodetic ones.
+
+    Uses Bowring's closed-form approximation, which is accurate to well
+    under a metre from the ground up to geostationary altitude.
+
+    Args:
+        x, y, z: Earth-fixed coordinates in km (arrays of equal shape).
+
+    Returns:
+        Tuple ``(lat_deg, lon_deg, alt_km)``.
+    """
+    p = np.hypot(x, y)
+    theta = np.arctan2(z * WGS84_A_KM, p * WGS84_B_KM)
+    sin_t = np.sin(theta)
+    cos_t = np.cos(theta)
+    lat = np.arctan2(
+        z + WGS84_EP2 * WGS84_B_KM * sin_t**3,
+        p - WGS84_E2 * WGS84_A_KM * cos_t**3,
+    )
+    lon = np.arctan2(y, x)
+
+    sin_lat = np.sin(lat)
+    n = WGS84_A_KM / np.sqrt(1.0 - WGS84_E2 * sin_lat**2)
+    # p / cos(lat) blows up near the poles; this form stays well conditioned
+    alt = p * np.cos(lat) + (z + WGS84_E2 * n * sin_lat) * sin_lat - n
+
+    return np.degrees(lat), np.degrees(lon), alt
+
+
+def _utc_jd_fraction(t: Time) -> float:
+    """Return the UTC fraction of *t*'s Julian date (whole part ``t.whole``).
+
+    TLE epochs are UTC, so SGP4 takes a UTC date.  Skyfield has no public
+    accessor for it; this mirrors ``EarthSatellite._at`` and is the only
+    place relying on the private ``Time._leap_seconds()``.
+    ``tests/test_propagation.py`` cross-checks the result against
+    ``EarthSatellite.at`` in case Skyfield changes it.
+    """
+    return t.tai_fraction - t._leap_seconds() / DAY_S
+
+
+def propagate_subpoints(
+    satrec_array: SatrecArray,
+    t: Time,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Propagate every satellite to time *t* and compute its sub-point.
+
+    Equivalent to ``EarthSatellite.at(t)`` followed by
+    ``wgs84.subpoint(...)`` (without polar motion), but for the whole
+    catalogue at once. Satellites whose propagation fails (non-zero SGP4
+    error code) come back as NaN.
+
+    Args:
+        satrec_array: Output of :func:`build_satrec_array`.
+        t: Skyfield time (scalar) to propagate to.
+
+    Returns:
+        Tuple ``(lat_deg, lon_deg, alt_km)`` of 1-D arrays aligned with
+        the rows of *satrec_array*.
+    """
+    jd = np.array([t.whole])
+    fr = np.array([_utc_jd_fraction(t)])
+    errors, r, _ = satrec_array.sgp4(jd, fr)
+    r_teme = r[:, 0, :]
+    # Flag every SGP4 error (including 6, "decayed") as NaN so callers
+    # can drop failures with one isfinite mask
+    r_teme[errors[:, 0] != 0] = np.nan
+
+    # TEME -> Earth-fixed is a single rotation about z by GMST
+    theta, _ = theta_GMST1982(t.whole, t.ut1_fraction)
+    cos_th, sin_th = np.cos(theta), np.sin(theta)
+    x = cos_th * r_teme[:, 0] + sin_th * r_teme[:, 1]
+    y = cos_th * r_teme[:, 1] - sin_th * r_teme[:, 0]
+
+    return ecef_to_geodetic(x, y, r_teme[:, 2])
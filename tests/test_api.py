@@ -3,17 +3,87 @@
 Sprint 10: Automated test suite using pytest + FastAPI TestClient.
 Sprint 11: Updated version assertions (1.0.0 -> 1.4.0),
            updated /api/positions test to expect 200 in degraded mode.
-Tests run without live TLE data (satellites may not be loaded).
+Tests run without live TLE data (satellites may not be loaded);
+pipeline tests load a small synthetic catalogue from a temp directory.
 """
 
+import asyncio
+import math
+import random
+import threading
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
+from skyfield.api import EarthSatellite
 
+import app.main as main
 from app.main import app
+from orbit_intel.dynamics import load_tle_objects
 
 client = TestClient(app)
 
 
+def _tle_checksum(line: str) -> str:
+    total = sum(int(c) if c.isdigit() else c == "-" for c in line[:68])
+    return str(total % 10)
+
+
+def _write_tle_catalogue(directory, count: int, seed: int) -> None:
+    """Write *count* synthetic LEO/MEO/GEO TLEs as the app's TLE file."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        satnum = 10000 + i
+        mean_motion = rng.choice(
+            [rng.uniform(11.5, 16.2), rng.uniform(1.9, 2.1), 1.0027]
+        )
+        ecc = rng.uniform(0.0, 0.02) if i % 25 else rng.uniform(0.3, 0.7)
+        line1 = (
+            f"1 {satnum:05d}U 98067A   25280.50000000  .00001000  "
+            f"00000-0  {rng.randint(10000, 99999):05d}-4 0  999"
+        )
+        line2 = (
+            f"2 {satnum:05d} {rng.uniform(0, 110):8.4f} "
+            f"{rng.uniform(0, 360):8.4f} {int(ecc * 1e7):07d} "
+            f"{rng.uniform(0, 360):8.4f} {rng.uniform(0, 360):8.4f} "
+            f"{mean_motion:11.8f}    1"
+        )
+        lines += [
+            f"SAT-{i}",
+            line1[:68] + _tle_checksum(line1),
+            line2[:68] + _tle_checksum(line2),
+        ]
+    (directory / main.TLE_FILENAME).write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def frozen_tick(monkeypatch):
+    """Pin time.time() so every request lands in the same positions tick."""
+    monkeypatch.setattr(main.time, "time", lambda: 1_760_000_000.25)
+
+
+@pytest.fixture
+def catalogue(tmp_path, reset_state):
+    """Load and analyse a 300-object synthetic catalogue; return the report."""
+    _write_tle_catalogue(tmp_path, 300, seed=1)
+    response = client.post(f"/api/v1/analyse?data_dir={tmp_path}")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def reset_state():
+    """Drop any catalogue, model and cache a pipeline test loaded."""
+    yield
+    main._set_satellites([])
+    main._set_anomalies(None)
+    main._set_report(None)
+    main._state["detector"] = None
+    main._analysis_cache.clear()
+    main._features_cache.clear()
+
+
 # ----------------------------------------------------------------
 # 1. Health check
 # ----------------------------------------------------------------
@@ -66,6 +136,38 @@ class TestPositions:
             assert "timestamp" in data
             assert isinstance(data["satellites"], list)
 
+    def test_positions_columnar_layout(self):
+        response = client.get("/api/positions?layout=columns")
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data["satellites"], dict)
+        for values in data["satellites"].values():
+            assert len(values) == data["total_satellites"]
+        assert client.get("/api/positions?layout=csv").status_code == 422
+
+    def test_positions_columnar_layout_degraded(self, reset_state):
+        main._set_satellites([])
+        data = client.get("/api/positions?layout=columns").json()
+        # Same keys as a loaded catalogue, each with no values
+        assert data["satellites"] == {
+            field: [] for field in main.SatellitePosition.model_fields
+        }
+
+    def test_positions_documents_both_layouts(self):
+        schema = client.get("/openapi.json").json()["paths"]["/api/positions"]
+        body = schema["get"]["responses"]["200"]["content"]["application/json"]
+        refs = {option["$ref"] for option in body["schema"]["anyOf"]}
+        assert refs == {
+            "#/components/schemas/PositionsResponse",
+            "#/components/schemas/PositionsColumnsResponse",
+        }
+
+    def test_positions_websocket_stream(self):
+        with client.websocket_connect("/ws/positions?filter_type=TOP10") as ws:
+            data = orjson.loads(ws.receive_bytes())
+            assert "satellites" in data
+            assert "total_satellites" in data
+
 
 # ----------------------------------------------------------------
 # 4. Anomalies endpoint
@@ -78,6 +180,10 @@ class TestAnomalies:
         # 200 if analysis ran during lifespan, 404 if not
         assert response.status_code in (200, 404)
 
+    def test_anomalies_rejects_out_of_range_min_score(self):
+        response = client.get("/api/v1/anomalies?min_score=1.5")
+        assert response.status_code == 422
+
 
 # ----------------------------------------------------------------
 # 5. Single satellite lookup
@@ -89,6 +195,11 @@ class TestSatelliteLookup:
         response = client.get("/api/v1/satellite/9999999")
         assert response.status_code == 404
 
+    def test_satellite_batch_reports_missing(self):
+        response = client.post("/api/v1/satellites/batch", json=[9999999])
+        assert response.status_code == 200
+        assert response.json() == {"satellites": [], "missing": [9999999]}
+
 
 # ----------------------------------------------------------------
 # 6. OpenAPI docs
@@ -106,3 +217,238 @@ class TestDocs:
         data = response.json()
         assert data["info"]["title"] == "AI-Orbit Intelligence 3D"
         assert data["info"]["version"] == "1.4.0"
+
+
+# ----------------------------------------------------------------
+# 7. Analyse pipeline (synthetic catalogue)
+# ----------------------------------------------------------------
+@pytest.mark.usefixtures("reset_state")
+class TestAnalyse:
+    """Verify /api/v1/analyse caching against real fits."""
+
+    def test_refit_after_rescore_retrains(self, tmp_path):
+        dir_a, dir_b = tmp_path / "a", tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        _write_tle_catalogue(dir_a, 300, seed=1)
+        _write_tle_catalogue(dir_b, 300, seed=2)
+
+        fitted_b = client.post(f"/api/v1/analyse?data_dir={dir_b}").json()
+        main._analysis_cache.clear()
+
+        client.post(f"/api/v1/analyse?data_dir={dir_a}")
+        rescored_b = client.post(
+            f"/api/v1/analyse?data_dir={dir_b}&refit=false"
+        ).json()
+        refitted_b = client.post(
+            f"/api/v1/analyse?data_dir={dir_b}&refit=true"
+        ).json()
+
+        # The re-score used A's model; refit=true must not return it
+        assert rescored_b["satellites"] != fitted_b["satellites"]
+        assert refitted_b == fitted_b
+
+
+# ----------------------------------------------------------------
+# 8. Positions cache across catalogue swaps
+# ----------------------------------------------------------------
+@pytest.mark.usefixtures("reset_state")
+class TestCatalogueSwap:
+    """Verify an in-flight positions build never leaks into a new catalogue."""
+
+    def test_swap_during_build(self, tmp_path, monkeypatch):
+        dir_a, dir_b = tmp_path / "a", tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        _write_tle_catalogue(dir_a, 200, seed=1)
+        _write_tle_catalogue(dir_b, 300, seed=2)
+        sats_a = load_tle_objects(dir_a)
+        sats_b = load_tle_objects(dir_b)
+
+        started, release = threading.Event(), threading.Event()
+        propagate = main.propagate_subpoints
+
+        def blocking_propagate(satrec_array, t):
+            if len(satrec_array) == len(sats_a):
+                started.set()
+                release.wait(5)
+            return propagate(satrec_array, t)
+
+        monkeypatch.setattr(main, "propagate_subpoints", blocking_propagate)
+
+        async def scenario():
+            main._set_satellites(sats_a)
+            in_flight = asyncio.create_task(
+                main._get_positions_payload("ALL", None, None)
+            )
+            await asyncio.to_thread(started.wait, 5)
+            main._set_satellites(sats_b)
+            release.set()
+            await in_flight
+            return await main._get_positions_payload("ALL", None, None)
+
+        _, payload, _ = asyncio.run(scenario())
+        data = orjson.loads(payload)
+        # B's catalogue (a few synthetic orbits fail SGP4 and are dropped)
+        assert len(sats_a) < data["total_satellites"] <= len(sats_b)
+        names = {sat["name"] for sat in data["satellites"]}
+        assert names <= {sat.name for sat in sats_b}
+
+
+# ----------------------------------------------------------------
+# 9. Positions & anomalies with a loaded catalogue
+# ----------------------------------------------------------------
+@pytest.mark.usefixtures("catalogue", "frozen_tick")
+class TestPositionsWithCatalogue:
+    """Verify filters, ordering, caching headers and compression on data."""
+
+    @staticmethod
+    def _positions(query: str = "") -> dict:
+        response = client.get(
+            f"/api/positions?{query}", headers={"Accept-Encoding": "identity"}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_etag_revalidation(self):
+        response = client.get("/api/positions")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=1"
+
+        again = client.get("/api/positions", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == etag
+
+        other = client.get(
+            "/api/positions", headers={"If-None-Match": '"stale"'}
+        )
+        assert other.status_code == 200
+        assert other.json()["total_satellites"] > 0
+
+    def test_orbit_and_anomaly_filters(self):
+        everything = self._positions()["satellites"]
+        by_orbit = {
+            orbit: self._positions(f"filter_type={orbit.lower()}")
+            for orbit in ("LEO", "MEO", "GEO")
+        }
+        assert sum(d["total_satellites"] for d in by_orbit.values()) == len(
+            everything
+        )
+        for orbit, data in by_orbit.items():
+            assert data["total_satellites"] > 0
+            assert {s["orbit_type"] for s in data["satellites"]} == {orbit}
+
+        flagged = self._positions("filter_type=ANOMALIES")["satellites"]
+        assert flagged
+        assert all(s["is_anomaly"] for s in flagged)
+        assert len(flagged) == sum(s["is_anomaly"] for s in everything)
+
+    def test_owner_and_object_type_filters(self):
+        # No SATCAT in tests: every object is UNKNOWN/UNKNOWN
+        total = self._positions()["total_satellites"]
+        assert self._positions("owner=%20unknown%20")["total_satellites"] == total
+        assert self._positions("object_type=Unknown")["total_satellites"] == total
+        assert self._positions("owner=US")["total_satellites"] == 0
+
+    def test_top10_ordering(self):
+        everything = self._positions()["satellites"]
+        top = self._positions("filter_type=TOP10")["satellites"]
+        # Highest scores first; ties keep catalogue order
+        expected = sorted(
+            everything, key=lambda s: s["anomaly_score"], reverse=True
+        )[:10]
+        assert [s["norad_id"] for s in top] == [
+            s["norad_id"] for s in expected
+        ]
+
+    def test_anomalies_min_score_cutoff(self, catalogue):
+        scores = sorted(
+            (s["anomaly_score"] for s in catalogue["satellites"]), reverse=True
+        )
+        cutoff = scores[7]
+        response = client.get(
+            f"/api/v1/anomalies?top_n=1000&min_score={cutoff}"
+        )
+        assert response.status_code == 200
+        result = [s["anomaly_score"] for s in response.json()]
+        assert result == [s for s in scores if s >= cutoff]
+
+    def test_gzip_matches_identity(self):
+        identity = client.get(
+            "/api/positions", headers={"Accept-Encoding": "identity"}
+        )
+        gzipped = client.get(
+            "/api/positions", headers={"Accept-Encoding": "gzip"}
+        )
+        assert "content-encoding" not in identity.headers
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.json() == identity.json()
+        # Each content-coding carries its own validator and both vary
+        assert gzipped.headers["etag"] != identity.headers["etag"]
+        assert identity.headers["vary"] == "Accept-Encoding"
+        assert gzipped.headers["vary"] == "Accept-Encoding"
+
+    def test_etag_revalidation_per_encoding(self):
+        identity_etag = client.get(
+            "/api/positions", headers={"Accept-Encoding": "identity"}
+        ).headers["etag"]
+        # The identity tag must not validate the gzip representation
+        gzipped = client.get(
+            "/api/positions",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": identity_etag},
+        )
+        assert gzipped.status_code == 200
+        again = client.get(
+            "/api/positions",
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": gzipped.headers["etag"],
+            },
+        )
+        assert again.status_code == 304
+        assert again.headers["vary"] == "Accept-Encoding"
+
+    def test_repeat_analysis_served_from_cache(self, tmp_path, monkeypatch):
+        first = client.post(f"/api/v1/analyse?data_dir={tmp_path}").json()
+        monkeypatch.setattr(
+            main,
+            "load_tle_objects",
+            lambda **_: pytest.fail("cached analysis re-parsed the TLE file"),
+        )
+        again = client.post(f"/api/v1/analyse?data_dir={tmp_path}").json()
+        assert again == first
+        # Another contamination refits but reuses the parsed features
+        wider = client.post(
+            f"/api/v1/analyse?data_dir={tmp_path}&contamination=0.1"
+        ).json()
+        assert wider["total_anomalies"] > first["total_anomalies"]
+
+
+# ----------------------------------------------------------------
+# 10. TLE extras (mean motion & inclination)
+# ----------------------------------------------------------------
+class TestTleExtras:
+    """Sprint 9 mean_motion / inclination extraction."""
+
+    def test_matches_scalar_rounding(self):
+        # 14.2951125 rev/day is an exact tie that np.round sends down
+        line1 = (
+            "1 10691U 98067A   25280.50000000  .00001000  00000-0  "
+            "14353-3 0  999"
+        )
+        line2 = (
+            "2 10691 107.6833 221.0443 0046181 258.3880 199.5271 "
+            "14.29511250    1"
+        )
+        sat = EarthSatellite(
+            line1 + _tle_checksum(line1), line2 + _tle_checksum(line2), "TIE"
+        )
+        mean_motion, inclination = main.build_tle_extra_arrays([sat])
+        assert mean_motion.tolist() == [
+            round(sat.model.no_kozai * 1440.0 / (2.0 * math.pi), 6)
+        ]
+        assert mean_motion.tolist() == [14.295113]
+        assert inclination.tolist() == [
+            round(math.degrees(sat.model.inclo), 4)
+        ]
@@ -0,0 +1,71 @@
+"""Tests for the batched SGP4 sub-point kernel.
+
+Cross-checks ``propagate_subpoints`` against Skyfield's own
+``EarthSatellite.at`` + ``wgs84.geographic_position_of`` path for a few
+fixed orbits.
+"""
+
+import numpy as np
+import pytest
+from skyfield.api import EarthSatellite, load, wgs84
+
+from orbit_intel.propagation import build_satrec_array, propagate_subpoints
+
+ts = load.timescale()
+
+
+def _with_checksum(line: str) -> str:
+    total = sum(int(c) if c.isdigit() else c == "-" for c in line[:68])
+    return line[:68] + str(total % 10)
+
+
+# name -> (line 1, line 2) without checksums
+TLES = {
+    "LEO": (
+        "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  999",
+        "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391    1",
+    ),
+    "GEO": (
+        "1 40000U 14001A   24001.50000000 -.00000100  00000-0  00000-0 0  999",
+        "2 40000   0.0500  80.0000 0002000 270.0000 150.0000  1.00270000    1",
+    ),
+    "ECCENTRIC": (
+        "1 40001U 14002A   24001.50000000  .00000100  00000-0  10000-3 0  999",
+        "2 40001  63.4000 100.0000 7200000 270.0000  10.0000  2.00600000    1",
+    ),
+    # Heavy drag: has re-entered (SGP4 error) by the test epoch
+    "DECAYED": (
+        "1 40002U 14003A   24001.50000000  .01000000  00000-0  10000-1 0  999",
+        "2 40002  51.6000 100.0000 0010000  90.0000  10.0000 16.40000000    1",
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def satellites():
+    return [
+        EarthSatellite(_with_checksum(l1), _with_checksum(l2), name, ts)
+        for name, (l1, l2) in TLES.items()
+    ]
+
+
+def test_subpoints_match_skyfield(satellites):
+    t = ts.utc(2024, 1, 20, 12)
+    lats, lons, alts = propagate_subpoints(build_satrec_array(satellites), t)
+
+    for sat, lat, lon, alt in zip(satellites, lats, lons, alts):
+        if sat.name == "DECAYED":
+            continue
+        expected = wgs84.geographic_position_of(sat.at(t))
+        assert lat == pytest.approx(expected.latitude.degrees, abs=1e-5)
+        assert lon == pytest.approx(expected.longitude.degrees, abs=1e-5)
+        assert alt == pytest.approx(expected.elevation.km, abs=1e-3)
+
+
+def test_failed_propagation_is_nan(satellites):
+    t = ts.utc(2024, 1, 20, 12)
+    lats, lons, alts = propagate_subpoints(build_satrec_array(satellites), t)
+
+    decayed = list(TLES).index("DECAYED")
+    assert np.isnan([lats[decayed], lons[decayed], alts[decayed]]).all()
+    assert np.isfinite(np.delete(alts, decayed)).all()